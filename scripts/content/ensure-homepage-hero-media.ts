@@ -34,6 +34,16 @@ const HERO_MANAGED_DIR = resolve(
   process.env.HOMEPAGE_HERO_GOLDEN_ROOT ?? join(REPO_ROOT, 'assets', 'design', 'homepage', 'hero'),
 );
 const HERO_MANAGED_LEDGER = join(HERO_MANAGED_DIR, 'managed-assets.json');
+/**
+ * Pillow-SIMD is a drop-in fork with SSE4/AVX2 composite + filter paths. Point this at
+ * `pillow-simd` on runners that have a compiler toolchain; stock Pillow remains the default.
+ */
+const HERO_PILLOW_PACKAGE = process.env.HOMEPAGE_HERO_PILLOW_PACKAGE ?? 'pillow';
+/**
+ * The renderer caches its output behind a `.hash` stamp and prints this prefix instead of
+ * rendering when the stamp still matches, so we can tell a cache hit apart from fresh artwork.
+ */
+const HERO_RENDERER_CACHE_HIT = '[hero-render] up to date';
 const IMAGE_MANIFEST_PATH = resolve(
   process.env.HOMEPAGE_HERO_MANIFEST_PATH ??
     join(REPO_ROOT, 'src', 'generated', 'image-optimization.manifest.json'),
@@ -308,6 +318,56 @@ async function shouldRegenerateHeroAsset(heroExists: boolean): Promise<boolean>
   return false;
 }
 
+/**
+ * The renderer writes a fully optimized PNG by default so production builds ship the smallest
+ * asset. Throwaway automation (e.g. test-only jobs) can opt into the faster, larger encode with
+ * `HOMEPAGE_HERO_PNG_MODE=fast`. `HOMEPAGE_HERO_FORCE_RENDER=1` bypasses the renderer's cache.
+ */
+function buildRendererArgs(): string[] {
+  const args = [HERO_RENDERER, '--output', HERO_ASSET_FILE];
+  if (process.env.HOMEPAGE_HERO_PNG_MODE === 'fast') {
+    args.push('--fast');
+  }
+  if (process.env.HOMEPAGE_HERO_FORCE_RENDER === '1') {
+    args.push('--force');
+  }
+  return args;
+}
+
+interface RendererRun {
+  exitCode: number;
+  cacheHit: boolean;
+}
+
+async function spawnRenderer(binary: string): Promise<RendererRun> {
+  return await new Promise((resolve, reject) => {
+    const child = spawn(binary, buildRendererArgs(), { stdio: ['inherit', 'pipe', 'inherit'] });
+    let output = '';
+    child.stdout.on('data', (chunk: Buffer) => {
+      process.stdout.write(chunk);
+      output += chunk.toString();
+    });
+    child.on('error', (error) => {
+      reject(error);
+    });
+    child.on('close', (code) => {
+      resolve({ exitCode: code ?? 1, cacheHit: output.includes(HERO_RENDERER_CACHE_HIT) });
+    });
+  });
+}
+
+function reportRendererSuccess(binary: string, run: RendererRun, context = ''): void {
+  if (run.cacheHit) {
+    console.info(
+      '[homepage-hero] Hero artwork already up to date; %s reused the cached render%s.',
+      binary,
+      context,
+    );
+    return;
+  }
+  console.info('[homepage-hero] Generated hero artwork via %s%s.', binary, context);
+}
+
 async function spawnProcess(binary: string, args: string[]): Promise<number> {
   return await new Promise((resolve, reject) => {
     const child = spawn(binary, args, { stdio: 'inherit' });
@@ -322,22 +382,33 @@ async function spawnProcess(binary: string, args: string[]): Promise<number> {
 
 async function installPillow(binary: string): Promise<boolean> {
   try {
-    console.info('[homepage-hero] Attempting `pip install pillow` via %s.', binary);
-    const exitCode = await spawnProcess(binary, ['-m', 'pip', 'install', '--quiet', 'pillow']);
+    console.info(
+      '[homepage-hero] Attempting `pip install %s numpy` via %s.',
+      HERO_PILLOW_PACKAGE,
+      binary,
+    );
+    const exitCode = await spawnProcess(binary, [
+      '-m',
+      'pip',
+      'install',
+      '--quiet',
+      HERO_PILLOW_PACKAGE,
+      'numpy',
+    ]);
     if (exitCode === 0) {
-      console.info('[homepage-hero] Pillow installation succeeded via %s.', binary);
+      console.info('[homepage-hero] Pillow/NumPy installation succeeded via %s.', binary);
       return true;
     }
     console.warn(
-      '[homepage-hero] Pillow installation via %s exited with code %s.',
+      '[homepage-hero] Pillow/NumPy installation via %s exited with code %s.',
       binary,
       exitCode,
     );
   } catch (error) {
     if (error && typeof error === 'object' && 'code' in error && error.code === 'ENOENT') {
-      console.warn('[homepage-hero] Cannot install Pillow because %s is missing.', binary);
+      console.warn('[homepage-hero] Cannot install Pillow/NumPy because %s is missing.', binary);
     } else {
-      console.warn('[homepage-hero] Pillow installation via %s failed: %s', binary, error);
+      console.warn('[homepage-hero] Pillow/NumPy installation via %s failed: %s', binary, error);
     }
   }
   return false;
@@ -375,33 +446,26 @@ export async function renderHeroProcedurally(): Promise<boolean> {
   let attemptedAutoInstall = false;
   for (const binary of candidates) {
     try {
-      const exitCode = await spawnProcess(binary, [HERO_RENDERER, '--output', HERO_ASSET_FILE]);
-      if (exitCode === 0) {
-        console.info('[homepage-hero] Generated hero artwork via %s.', binary);
+      const run = await spawnRenderer(binary);
+      if (run.exitCode === 0) {
+        reportRendererSuccess(binary, run);
         return true;
       }
-      console.warn('[homepage-hero] Renderer %s exited with code %s.', binary, exitCode);
+      console.warn('[homepage-hero] Renderer %s exited with code %s.', binary, run.exitCode);
 
       if (!attemptedAutoInstall) {
         attemptedAutoInstall = true;
         const installed = await installPillow(binary);
         if (installed) {
-          const retryExit = await spawnProcess(binary, [
-            HERO_RENDERER,
-            '--output',
-            HERO_ASSET_FILE,
-          ]);
-          if (retryExit === 0) {
-            console.info(
-              '[homepage-hero] Generated hero artwork via %s after installing Pillow.',
-              binary,
-            );
+          const retry = await spawnRenderer(binary);
+          if (retry.exitCode === 0) {
+            reportRendererSuccess(binary, retry, ' after installing Pillow/NumPy');
             return true;
           }
           console.warn(
-            '[homepage-hero] Renderer %s still failed after installing Pillow (code %s).',
+            '[homepage-hero] Renderer %s still failed after installing Pillow/NumPy (code %s).',
             binary,
-            retryExit,
+            retry.exitCode,
           );
         }
       }
@@ -414,7 +478,9 @@ export async function renderHeroProcedurally(): Promise<boolean> {
     }
   }
 
-  console.warn('[homepage-hero] Unable to render hero procedurally. Install Pillow and retry.');
+  console.warn(
+    '[homepage-hero] Unable to render hero procedurally. Install Pillow and NumPy, then retry.',
+  );
   return false;
 }
 